@@ -1,11 +1,51 @@
 import asyncio
+import logging
+import signal
 
 from .bot import MeloTTSBot, register_commands
 from .config import load_settings
 from .logging_setup import configure_logging
+from .profiling import profiler
 from .tts import MeloTtsEngine
 
 
+# SIGUSR1 한 번으로 열리는 프로파일링 구간 길이(초)
+SIGNAL_PROFILE_SECONDS = 30.0
+
+
+def _install_profile_signal() -> None:
+    # SIGUSR1을 받으면 프로파일링을 시작하고, 진행 중이면 조기 종료
+    if not hasattr(signal, "SIGUSR1"):
+        return
+    loop = asyncio.get_running_loop()
+    logger = logging.getLogger("gi_talker.profiling")
+    pending: set[asyncio.Task[None]] = set()
+
+    async def _stop() -> None:
+        # 리포트 작성은 별도 스레드에서 기다리고 결과 위치를 남긴다
+        report = await asyncio.to_thread(profiler.stop)
+        if report:
+            paths = (report.folded_path, report.alloc_path, report.summary_path)
+            logger.info(
+                "프로파일링 결과: %s", ", ".join(str(path) for path in paths if path)
+            )
+        else:
+            logger.warning("프로파일링 결과를 저장하지 못했습니다.")
+
+    def _toggle() -> None:
+        if profiler.running:
+            task = loop.create_task(_stop())
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            return
+        try:
+            profiler.start(SIGNAL_PROFILE_SECONDS)
+        except (RuntimeError, OSError) as exc:
+            logger.error("프로파일링 시작 실패: %s", exc)
+
+    loop.add_signal_handler(signal.SIGUSR1, _toggle)
+
+
 async def run_bot() -> None:
     # 로깅을 가장 먼저 초기화해 이후 단계에서 발생할 로그를 잡는다
     configure_logging()
@@ -25,6 +65,7 @@ async def run_bot() -> None:
     )
     bot = MeloTTSBot(settings=settings, tts_engine=engine)
     register_commands(bot)
+    _install_profile_signal()
     await bot.start(settings.token)
 
 
@@ -1,9 +1,10 @@
 # 디스코드 봇의 기본 동작을 담당하는 모듈
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import discord
 from discord import app_commands
@@ -11,6 +12,7 @@ from discord.errors import HTTPException, NotFound
 
 from .config import BotSettings
 from .preferences import UserPreferences
+from .profiling import MAX_DURATION, profiler
 from .tts import MeloTtsEngine, SynthesisRequest
 from .voice import VoiceSession, ensure_voice
 
@@ -26,6 +28,7 @@ class MeloTTSBot(discord.Client):
         super().__init__(intents=intents)
         self.tree = app_commands.CommandTree(self)
         self._preferences = UserPreferences(Path("data/preferences.json"))
+        self._owner_ids: Optional[set[int]] = None
 
     async def setup_hook(self) -> None:
         if self._command_guild_ids:
@@ -70,9 +73,21 @@ class MeloTTSBot(discord.Client):
         self._voice_session = await ensure_voice(target_channel)
         return self._voice_session
 
+    async def _is_owner(self, user: discord.abc.User) -> bool:
+        # 애플리케이션 소유자(팀이면 팀 구성원)만 관리 명령을 쓸 수 있도록 확인
+        if self._owner_ids is None:
+            app_info = await self.application_info()
+            if app_info.team:
+                self._owner_ids = {member.id for member in app_info.team.members}
+            else:
+                self._owner_ids = {app_info.owner.id}
+        return user.id in self._owner_ids
+
     async def close(self) -> None:
         if self._voice_session:
             await self._voice_session.disconnect()
+        if profiler.running:
+            await asyncio.to_thread(profiler.stop)
         await super().close()
 
 
@@ -107,9 +122,7 @@ def register_commands(bot: MeloTTSBot) -> None:
                 "연결된 음성 채널이 없어요.", ephemeral=True
             )
 
-    @bot.tree.command(name="say", description="텍스트를 음성으로 재생합니다.")
-    @app_commands.describe(text="재생할 메시지")
-    async def say(interaction: discord.Interaction, text: str) -> None:
+    async def _say(interaction: discord.Interaction, text: str) -> None:
         if not interaction.response.is_done():
             try:
                 await interaction.response.defer(ephemeral=True, thinking=True)
@@ -178,6 +191,12 @@ def register_commands(bot: MeloTTSBot) -> None:
                 "재생 중 문제가 발생했어요.", ephemeral=True
             )
 
+    @bot.tree.command(name="say", description="텍스트를 음성으로 재생합니다.")
+    @app_commands.describe(text="재생할 메시지")
+    async def say(interaction: discord.Interaction, text: str) -> None:
+        with profiler.measure("/say"):
+            await _say(interaction, text)
+
     @bot.tree.command(name="set_voice", description="사용할 화자를 지정합니다.")
     @app_commands.describe(speaker="사용할 화자 이름")
     async def set_voice(interaction: discord.Interaction, speaker: str) -> None:
@@ -219,3 +238,67 @@ def register_commands(bot: MeloTTSBot) -> None:
         await interaction.response.send_message(
             "개인 화자 설정을 초기화했어요.", ephemeral=True
         )
+
+    @bot.tree.command(name="profile", description="핫패스 프로파일링을 제어합니다. (소유자 전용)")
+    @app_commands.describe(
+        action="start/stop/status",
+        seconds="프로파일링 시간(초)",
+        mode="cpu: 스택 샘플링, alloc: 메모리 할당 추적(부하 큼)",
+    )
+    async def profile(
+        interaction: discord.Interaction,
+        action: Literal["start", "stop", "status"] = "start",
+        seconds: app_commands.Range[int, 1, int(MAX_DURATION)] = 30,
+        mode: Literal["cpu", "alloc"] = "cpu",
+    ) -> None:
+        try:
+            is_owner = await bot._is_owner(interaction.user)
+        except HTTPException as exc:
+            bot._logger.warning("Failed to fetch application info: %s", exc)
+            await interaction.response.send_message(
+                "소유자 정보를 확인하지 못했어요.", ephemeral=True
+            )
+            return
+        if not is_owner:
+            await interaction.response.send_message(
+                "봇 소유자만 사용할 수 있어요.", ephemeral=True
+            )
+            return
+
+        if action == "start":
+            try:
+                prefix = profiler.start(seconds, mode)
+            except RuntimeError as exc:
+                await interaction.response.send_message(str(exc), ephemeral=True)
+                return
+            except OSError as exc:
+                bot._logger.exception("프로파일링 시작 실패", exc_info=exc)
+                await interaction.response.send_message(
+                    "프로파일링을 시작하지 못했어요.", ephemeral=True
+                )
+                return
+            await interaction.response.send_message(
+                f"{seconds}초 동안 {mode} 프로파일링할게요. 결과: `{prefix}-*`",
+                ephemeral=True,
+            )
+        elif action == "stop":
+            if not profiler.running:
+                await interaction.response.send_message(
+                    "진행 중인 프로파일링이 없어요.", ephemeral=True
+                )
+                return
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            report = await asyncio.to_thread(profiler.stop)
+            message = (
+                f"프로파일링을 종료했어요. 요약: `{report.summary_path}`"
+                if report
+                else "프로파일링을 종료했지만 결과 저장에 실패했어요."
+            )
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            report = profiler.last_report
+            state = f"진행 중({profiler.mode})" if profiler.running else "대기 중"
+            last = f"`{report.summary_path}`" if report else "없음"
+            await interaction.response.send_message(
+                f"상태: {state}, 마지막 결과: {last}", ephemeral=True
+            )
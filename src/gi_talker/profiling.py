@@ -0,0 +1,392 @@
+# 운영 중 지연 원인 분석을 위한 온디맨드 프로파일링 모듈
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ProfileMode = Literal["cpu", "alloc"]
+
+# 한 번에 허용하는 최대 프로파일링 시간(초)
+MAX_DURATION = 300.0
+
+# 스택 최상단이 이 함수들이면 대기 중인 스레드로 보고 샘플에서 제외.
+# 같은 이름의 다른 파일과 섞이지 않도록 경로 끝부분으로 비교한다
+_IDLE_FRAMES = {
+    "/selectors.py": {"select", "poll"},
+    "/threading.py": {"wait", "_wait_for_tstate_lock", "join"},
+    "/queue.py": {"get"},
+    # 유휴 ThreadPoolExecutor 워커는 C 레벨 SimpleQueue.get에서 대기한다
+    "/concurrent/futures/thread.py": {"_worker"},
+}
+
+# 현재 컨텍스트(스레드 또는 asyncio 태스크)에서 진입해 있는 구간 경로
+_span_path: contextvars.ContextVar[Tuple[str, ...]] = contextvars.ContextVar(
+    "gi_talker_span_path", default=()
+)
+
+
+@dataclass
+class SpanStats:
+    # 구간 호출 횟수와 소요 시간 통계
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+@dataclass
+class ProfileReport:
+    # 프로파일링 결과 파일 경로 모음 (모드에 따라 일부만 생성)
+    mode: ProfileMode
+    summary_path: Path
+    folded_path: Optional[Path] = None
+    alloc_path: Optional[Path] = None
+
+
+@dataclass
+class _Window:
+    # 진행 중인 프로파일링 구간의 상태
+    mode: ProfileMode
+    started_at: float
+    deadline: float
+    prefix: Path
+    stop_event: threading.Event = field(default_factory=threading.Event)
+    stacks: Counter = field(default_factory=Counter)
+    spans: Dict[str, SpanStats] = field(default_factory=dict)
+    # 샘플링 틱 수 (스레드 수와 무관하게 구간 간 비교 가능)
+    samples: int = 0
+    # 실제로 기록된 스레드 스택 수
+    stack_samples: int = 0
+    tracemalloc_owned: bool = False
+
+
+class _Measure:
+    # with 문으로 감싸는 측정 구간 (비활성 시 아무것도 하지 않음)
+    __slots__ = ("_profiler", "_name", "_state")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._state: Optional[Tuple[contextvars.Token, float]] = None
+
+    def __enter__(self) -> None:
+        if self._profiler.enabled:
+            self._state = self._profiler._enter(self._name)
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._state is not None:
+            self._profiler._exit(self._state)
+            self._state = None
+
+
+class Profiler:
+    def __init__(
+        self,
+        output_dir: Path = Path("data/profiles"),
+        *,
+        interval: float = 0.005,
+        trace_frames: int = 1,
+        top_allocations: int = 30,
+    ) -> None:
+        self._output_dir = output_dir
+        self._interval = interval
+        self._trace_frames = trace_frames
+        self._top_allocations = top_allocations
+        self._logger = logging.getLogger("gi_talker.profiling")
+        self._lock = threading.Lock()
+        self._window: Optional[_Window] = None
+        self._thread: Optional[threading.Thread] = None
+        self._last_report: Optional[ProfileReport] = None
+        # 비활성 상태에서는 이 값만 확인하고 즉시 원래 함수를 호출
+        self.enabled = False
+
+    @property
+    def running(self) -> bool:
+        # 리포트 작성이 끝날 때까지 진행 중으로 취급해 구간이 겹치지 않게 한다
+        return self._thread is not None
+
+    @property
+    def mode(self) -> Optional[ProfileMode]:
+        window = self._window
+        return window.mode if window else None
+
+    @property
+    def last_report(self) -> Optional[ProfileReport]:
+        return self._last_report
+
+    def start(self, duration: float, mode: ProfileMode = "cpu") -> Path:
+        if duration <= 0:
+            raise ValueError("프로파일링 시간은 0보다 커야 합니다.")
+        if mode not in ("cpu", "alloc"):
+            raise ValueError(f"알 수 없는 프로파일링 모드입니다: {mode}")
+        duration = min(duration, MAX_DURATION)
+
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("이미 프로파일링이 진행 중입니다.")
+
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            now = time.perf_counter()
+            window = _Window(
+                mode=mode,
+                started_at=now,
+                deadline=now + duration,
+                prefix=self._next_prefix(),
+            )
+            # 할당 추적은 부하가 커서 alloc 모드에서만 켠다.
+            # 다른 곳에서 이미 tracemalloc을 켰다면 종료 시 끄지 않는다
+            if mode == "alloc" and not tracemalloc.is_tracing():
+                tracemalloc.start(self._trace_frames)
+                window.tracemalloc_owned = True
+
+            self._window = window
+            self.enabled = True
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(window,),
+                name="gi-talker-profiler",
+                daemon=True,
+            )
+            self._thread.start()
+
+        self._logger.info(
+            "프로파일링 시작(%s): %.1f초, 출력 %s-*", mode, duration, window.prefix
+        )
+        return window.prefix
+
+    def stop(self) -> Optional[ProfileReport]:
+        # 진행 중인 구간을 조기 종료하고 리포트 작성까지 기다린다.
+        # 이미 끝난 구간이면 마지막 리포트를 그대로 돌려준다
+        with self._lock:
+            window = self._window
+            thread = self._thread
+        if window is not None and thread is not None:
+            window.stop_event.set()
+            thread.join()
+        return self._last_report
+
+    def _next_prefix(self) -> Path:
+        # 같은 초에 연달아 시작해도 이전 결과를 덮어쓰지 않도록 번호를 붙인다
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        prefix = self._output_dir / f"profile-{stamp}"
+        index = 1
+        while prefix.with_name(prefix.name + "-summary.txt").exists():
+            index += 1
+            prefix = self._output_dir / f"profile-{stamp}-{index}"
+        return prefix
+
+    def _run(self, window: _Window) -> None:
+        own_id = threading.get_ident()
+        try:
+            while not window.stop_event.is_set():
+                remaining = window.deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                if window.mode == "cpu":
+                    self._sample(window, own_id)
+                    window.stop_event.wait(min(self._interval, remaining))
+                else:
+                    window.stop_event.wait(remaining)
+        finally:
+            self.enabled = False
+            try:
+                self._finish(window)
+            finally:
+                with self._lock:
+                    self._window = None
+                    self._thread = None
+
+    def _sample(self, window: _Window, own_id: int) -> None:
+        # 모든 스레드를 스레드 이름으로 구분해 접힌(folded) 스택으로 집계한다.
+        # 음성 재생(AudioPlayer) 스레드도 여기서 함께 잡힌다
+        window.samples += 1
+        names = {
+            thread.ident: _thread_label(thread) for thread in threading.enumerate()
+        }
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id or _is_idle(frame):
+                continue
+            stack: List[str] = []
+            current = frame
+            while current is not None:
+                code = current.f_code
+                stack.append(
+                    f"{code.co_name} ({code.co_filename}:{current.f_lineno})"
+                )
+                current = current.f_back
+            stack.reverse()
+            label = names.get(thread_id, f"thread-{thread_id}")
+            window.stacks[";".join([label, *stack])] += 1
+            window.stack_samples += 1
+
+    def _finish(self, window: _Window) -> None:
+        self._last_report = None
+        report = ProfileReport(
+            mode=window.mode,
+            summary_path=window.prefix.with_name(window.prefix.name + "-summary.txt"),
+        )
+        snapshot: Optional[tracemalloc.Snapshot] = None
+        if window.mode == "alloc":
+            report.alloc_path = window.prefix.with_name(
+                window.prefix.name + "-alloc.txt"
+            )
+            try:
+                if tracemalloc.is_tracing():
+                    snapshot = tracemalloc.take_snapshot()
+            finally:
+                if window.tracemalloc_owned:
+                    tracemalloc.stop()
+        else:
+            report.folded_path = window.prefix.with_name(
+                window.prefix.name + "-cpu.folded"
+            )
+
+        try:
+            if report.folded_path is not None:
+                self._write_folded(report.folded_path, window)
+            if report.alloc_path is not None:
+                self._write_allocations(report.alloc_path, snapshot)
+            self._write_summary(report.summary_path, window)
+        except OSError as exc:
+            self._logger.error("프로파일링 결과 저장 실패: %s", exc)
+            return
+
+        self._last_report = report
+        self._logger.info(
+            "프로파일링 종료(%s): 샘플 %d개, 결과 %s",
+            window.mode,
+            window.samples,
+            window.prefix,
+        )
+
+    def _write_folded(self, path: Path, window: _Window) -> None:
+        # flamegraph.pl, speedscope 등에서 그대로 읽을 수 있는 형식
+        lines = [f"{stack} {count}" for stack, count in window.stacks.most_common()]
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+    def _write_allocations(
+        self, path: Path, snapshot: Optional[tracemalloc.Snapshot]
+    ) -> None:
+        if snapshot is None:
+            path.write_text("tracemalloc 스냅샷이 없습니다.\n", encoding="utf-8")
+            return
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        stats = snapshot.statistics("traceback")
+        lines: List[str] = []
+        for index, stat in enumerate(stats[: self._top_allocations], start=1):
+            lines.append(
+                f"#{index}: {stat.size / 1024:.1f} KiB in {stat.count} blocks"
+            )
+            lines.extend(f"    {line}" for line in stat.traceback.format())
+        total = sum(stat.size for stat in stats)
+        lines.append(f"total: {total / 1024:.1f} KiB")
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def _write_summary(self, path: Path, window: _Window) -> None:
+        elapsed = time.perf_counter() - window.started_at
+        lines = [
+            f"mode: {window.mode}, window: {elapsed:.2f}s, "
+            f"samples: {window.samples}, stacks: {window.stack_samples}"
+        ]
+        if window.mode == "alloc":
+            # tracemalloc이 켜진 동안의 시간이라 실제 지연보다 크게 측정된다
+            lines.append("note: timings include tracemalloc overhead")
+        for name, stats in sorted(list(window.spans.items())):
+            average = stats.total / stats.count if stats.count else 0.0
+            lines.append(
+                f"{name}: count={stats.count} total={stats.total * 1000:.1f}ms "
+                f"avg={average * 1000:.1f}ms max={stats.max * 1000:.1f}ms"
+            )
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def _enter(self, name: str) -> Tuple[contextvars.Token, float]:
+        # 스레드가 아닌 컨텍스트 단위로 경로를 쌓아 코루틴끼리 섞이지 않게 한다
+        token = _span_path.set(_span_path.get() + (name,))
+        return token, time.perf_counter()
+
+    def _exit(self, state: Tuple[contextvars.Token, float]) -> None:
+        token, started = state
+        elapsed = time.perf_counter() - started
+        path = _span_path.get()
+        _span_path.reset(token)
+        window = self._window
+        if self.enabled and window is not None:
+            window.spans.setdefault(" > ".join(path), SpanStats()).add(elapsed)
+
+    def measure(self, name: str) -> _Measure:
+        # 데코레이터를 붙이기 어려운 코드 블록(슬래시 커맨드 본문 등)용
+        return _Measure(self, name)
+
+    def span(self, name: str) -> Callable[[F], F]:
+        # 동기/비동기 함수 모두에 붙일 수 있는 핫패스 측정 데코레이터
+        def decorator(func: F) -> F:
+            if asyncio.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    state = self._enter(name)
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        self._exit(state)
+
+                return async_wrapper  # type: ignore[return-value]
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                state = self._enter(name)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._exit(state)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+
+def _thread_label(thread: threading.Thread) -> str:
+    # discord.py의 AudioPlayer처럼 Thread 하위 클래스는 클래스 이름을 붙여 구분
+    if type(thread) is threading.Thread or thread is threading.main_thread():
+        return thread.name
+    return f"{type(thread).__name__}:{thread.name}"
+
+
+def _is_idle(frame: Any) -> bool:
+    code = frame.f_code
+    filename = code.co_filename.replace(os.sep, "/")
+    return any(
+        filename.endswith(suffix) and code.co_name in idle_names
+        for suffix, idle_names in _IDLE_FRAMES.items()
+    )
+
+
+# 엔진/음성/봇 모듈이 공유하는 전역 프로파일러
+profiler = Profiler()
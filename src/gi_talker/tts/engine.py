@@ -6,6 +6,8 @@ from typing import Dict, Optional
 
 import numpy as np
 
+from ..profiling import profiler
+
 
 try:
     # MeloTTS는 설치 시 `melo` 패키지를 제공한다.
@@ -118,6 +120,7 @@ class MeloTtsEngine:
 
         raise ValueError("사용 가능한 기본 화자가 설정되지 않았습니다.")
 
+    @profiler.span("MeloTtsEngine.synthesize")
     def synthesize(self, request: SynthesisRequest) -> SynthesisResult:
         self.load()
         assert self._model is not None
@@ -7,6 +7,8 @@ import tempfile
 import numpy as np
 import discord
 
+from .profiling import profiler
+
 
 class VoiceSession:
     def __init__(self, voice_client: discord.VoiceClient) -> None:
@@ -19,6 +21,7 @@ class VoiceSession:
         # 현재 연결된 채널을 노출
         return self._voice_client.channel
 
+    @profiler.span("VoiceSession.play_pcm")
     async def play_pcm(self, pcm: bytes, sample_rate: int) -> None:
         # 합성 결과를 임시 WAV 파일로 저장 후 FFmpeg를 통해 재생
         async with self._play_lock:
@@ -0,0 +1,222 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+import tracemalloc
+
+import pytest
+
+from gi_talker.profiling import Profiler
+
+
+def _wait_until_idle(profiler: Profiler, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while profiler.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not profiler.running
+
+
+def _busy(seconds: float) -> int:
+    total = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+def _summary_lines(report) -> dict:
+    lines = report.summary_path.read_text(encoding="utf-8").splitlines()
+    return {line.split(":", 1)[0]: line for line in lines[1:]}
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    instance = Profiler(tmp_path, interval=0.001)
+    yield instance
+    instance.stop()
+
+
+def test_disabled_span_passes_through(profiler):
+    @profiler.span("sync")
+    def work(value):
+        return value * 2
+
+    assert not profiler.enabled
+    assert work(21) == 42
+    assert work.__name__ == "work"
+
+
+def test_start_rejects_invalid_arguments(profiler):
+    with pytest.raises(ValueError):
+        profiler.start(0)
+    with pytest.raises(ValueError):
+        profiler.start(1, "wall")  # type: ignore[arg-type]
+    assert not profiler.running
+
+
+def test_start_while_running_raises(profiler):
+    profiler.start(30)
+    with pytest.raises(RuntimeError):
+        profiler.start(30)
+
+
+def test_cpu_report_contents(profiler):
+    @profiler.span("hot")
+    def hot():
+        return _busy(0.1)
+
+    profiler.start(30)
+    hot()
+    report = profiler.stop()
+
+    assert report is not None
+    assert report.mode == "cpu"
+    assert report.alloc_path is None
+    assert not profiler.running and not profiler.enabled
+
+    folded = report.folded_path.read_text(encoding="utf-8").splitlines()
+    assert folded
+    for line in folded:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert stack.split(";")[0]
+    # 메인 스레드에서 실행된 hot 함수가 스레드 이름과 함께 잡혀야 한다
+    assert any(
+        line.startswith("MainThread;") and "_busy" in line for line in folded
+    )
+
+    summary = report.summary_path.read_text(encoding="utf-8").splitlines()
+    assert summary[0].startswith("mode: cpu")
+    assert "count=1" in _summary_lines(report)["hot"]
+
+
+def test_cpu_samples_other_threads_and_skips_idle(profiler):
+    class AudioPlayer(threading.Thread):
+        def run(self):
+            _busy(0.2)
+
+    profiler.start(30)
+    player = AudioPlayer(name="player")
+    player.start()
+    player.join()
+    report = profiler.stop()
+
+    folded = report.folded_path.read_text(encoding="utf-8").splitlines()
+    assert any(line.startswith("AudioPlayer:player;") for line in folded)
+    # join/select 등에서 대기 중인 스택은 샘플에 남지 않는다
+    for line in folded:
+        top = line.rsplit(" ", 1)[0].split(";")[-1]
+        assert not top.startswith(("wait (", "_wait_for_tstate_lock (", "select ("))
+
+
+def test_cpu_skips_idle_executor_workers(profiler):
+    # asyncio.to_thread처럼 한 번 쓰고 대기 중인 워커는 샘플에 남지 않아야 한다
+    with ThreadPoolExecutor(thread_name_prefix="idle-worker") as executor:
+        executor.submit(lambda: None).result()
+        profiler.start(30)
+        time.sleep(0.1)
+        report = profiler.stop()
+
+    folded = report.folded_path.read_text(encoding="utf-8")
+    assert "idle-worker" not in folded
+    assert "_worker (" not in folded
+
+
+def test_samples_count_ticks_not_stacks(profiler):
+    profiler.start(30)
+    threading.Event().wait(0.1)
+    report = profiler.stop()
+
+    header = report.summary_path.read_text(encoding="utf-8").splitlines()[0]
+    fields = dict(part.split(": ") for part in header.split(", "))
+    # 대기 중인 스레드만 있어도 샘플링 틱은 쌓이고, 기록된 스택은 없다
+    assert int(fields["samples"]) > 0
+    assert int(fields["stacks"]) == 0
+
+
+def test_async_span_is_scoped_to_its_task(profiler):
+    @profiler.span("outer")
+    async def outer():
+        await asyncio.sleep(0.05)
+        inner()
+
+    @profiler.span("inner")
+    def inner():
+        return None
+
+    @profiler.span("other")
+    async def other():
+        await asyncio.sleep(0.01)
+        inner()
+
+    async def main():
+        await asyncio.gather(outer(), other())
+
+    profiler.start(30)
+    asyncio.run(main())
+    report = profiler.stop()
+
+    spans = _summary_lines(report)
+    assert "count=1" in spans["outer"]
+    assert "count=1" in spans["other"]
+    assert "outer > inner" in spans
+    assert "other > inner" in spans
+    # 다른 태스크의 구간이 섞이면 "outer > other" 같은 경로가 생긴다
+    assert not any(">" in key and "outer" in key and "other" in key for key in spans)
+
+
+def test_measure_records_block(profiler):
+    profiler.start(30)
+    with profiler.measure("/say"):
+        time.sleep(0.01)
+    report = profiler.stop()
+
+    assert "count=1" in _summary_lines(report)["/say"]
+
+
+def test_expired_window_still_returns_report(profiler):
+    profiler.start(0.05)
+    _wait_until_idle(profiler)
+
+    report = profiler.stop()
+    assert report is not None
+    assert report.summary_path.exists()
+    assert report is profiler.last_report
+
+
+def test_restart_after_window_uses_new_prefix(profiler):
+    first = profiler.start(0.05)
+    _wait_until_idle(profiler)
+    second = profiler.start(0.05)
+    _wait_until_idle(profiler)
+
+    assert first != second
+    assert first.with_name(first.name + "-summary.txt").exists()
+    assert second.with_name(second.name + "-summary.txt").exists()
+
+
+def test_alloc_mode_owns_and_releases_tracemalloc(profiler):
+    assert not tracemalloc.is_tracing()
+    profiler.start(30, "alloc")
+    assert tracemalloc.is_tracing()
+    kept = [bytearray(1024) for _ in range(100)]
+    report = profiler.stop()
+
+    assert not tracemalloc.is_tracing()
+    assert report.mode == "alloc"
+    assert report.folded_path is None
+    text = report.alloc_path.read_text(encoding="utf-8")
+    assert text.startswith("#1:")
+    assert "total:" in text
+    assert "tracemalloc overhead" in report.summary_path.read_text(encoding="utf-8")
+    del kept
+
+
+def test_alloc_restart_keeps_tracemalloc_for_new_window(profiler):
+    profiler.start(0.05, "alloc")
+    _wait_until_idle(profiler)
+    profiler.start(30, "alloc")
+    assert tracemalloc.is_tracing()
+    report = profiler.stop()
+
+    assert "스냅샷이 없습니다" not in report.alloc_path.read_text(encoding="utf-8")